@@ -123,9 +123,9 @@ def fuselage_inertia(SPACING, center_of_gravity, mass_seg_i, ag, cpacs_in):
                 sfy.extend(y)
                 sfz.extend(z)
         M = mass_seg_i[int(i) - 1, f + a - 1] / np.max(np.shape(fx))
-        fcx = fx - (np.zeros((np.shape(fx))) + center_of_gravity[0])
-        fcy = fy - (np.zeros((np.shape(fx))) + center_of_gravity[1])
-        fcz = fz - (np.zeros((np.shape(fx))) + center_of_gravity[2])
+        fcx = np.asarray(fx) - center_of_gravity[0]
+        fcy = np.asarray(fy) - center_of_gravity[1]
+        fcz = np.asarray(fz) - center_of_gravity[2]
         Ixx += np.sum(M * np.add(fcy**2, fcz**2))
         Iyy += np.sum(M * np.add(fcx**2, fcz**2))
         Izz += np.sum(M * np.add(fcx**2, fcy**2))
@@ -155,9 +155,9 @@ def fuselage_inertia(SPACING, center_of_gravity, mass_seg_i, ag, cpacs_in):
             [sfx.append(y) for y in fy_t]
             [sfx.append(z) for z in fz_t]
             M = mass_seg_i[int(i) - 1, f + a - 1] / np.max(np.shape(fx))
-            fcx_t = fx_t - (np.zeros((np.shape(fx_t))) + center_of_gravity[0])
-            fcy_t = fy_t - (np.zeros((np.shape(fy_t))) + center_of_gravity[1])
-            fcz_t = fz_t - (np.zeros((np.shape(fz_t))) + center_of_gravity[2])
+            fcx_t = fx_t - center_of_gravity[0]
+            fcy_t = fy_t - center_of_gravity[1]
+            fcz_t = fz_t - center_of_gravity[2]
             Ixx += np.sum(M * np.add(fcy_t**2, fcz_t**2))
             Iyy += np.sum(M * np.add(fcx_t**2, fcz_t**2))
             Izz += np.sum(M * np.add(fcx_t**2, fcy_t**2))
@@ -266,9 +266,9 @@ def wing_inertia(subd_c, SPACING, center_of_gravity, mass_seg_i, ag, cpacs_in):
                     swy.extend((yl, yu))
                     swz.extend((zl, zu))
             M = mass_seg_i[int(i) - 1, ag.fuse_nb + w + a - 1] / np.max(np.shape(wx))
-            wcx = wx - (np.zeros((np.shape(wx))) + center_of_gravity[0])
-            wcy = wy - (np.zeros((np.shape(wy))) + center_of_gravity[1])
-            wcz = wz - (np.zeros((np.shape(wz))) + center_of_gravity[2])
+            wcx = np.asarray(wx) - center_of_gravity[0]
+            wcy = np.asarray(wy) - center_of_gravity[1]
+            wcz = np.asarray(wz) - center_of_gravity[2]
             Ixx += np.sum(M * np.add(wcy**2, wcz**2))
             Iyy += np.sum(M * np.add(wcx**2, wcz**2))
             Izz += np.sum(M * np.add(wcx**2, wcy**2))
@@ -295,9 +295,9 @@ def wing_inertia(subd_c, SPACING, center_of_gravity, mass_seg_i, ag, cpacs_in):
                 [swy.append(y) for y in wy_t]
                 [swz.append(z) for z in wz_t]
                 M = mass_seg_i[int(i) - 1, ag.fuse_nb + w + a - 1] / np.max(np.shape(wx_t))
-                wcx_t = wx_t - (np.zeros((np.shape(wx_t))) + center_of_gravity[0])
-                wcy_t = wy_t - (np.zeros((np.shape(wy_t))) + center_of_gravity[1])
-                wcz_t = wz_t - (np.zeros((np.shape(wz_t))) + center_of_gravity[2])
+                wcx_t = wx_t - center_of_gravity[0]
+                wcy_t = wy_t - center_of_gravity[1]
+                wcz_t = wz_t - center_of_gravity[2]
                 Ixx += np.sum(M * np.add(wcy_t**2, wcz_t**2))
                 Iyy += np.sum(M * np.add(wcx_t**2, wcz_t**2))
                 Izz += np.sum(M * np.add(wcx_t**2, wcy_t**2))
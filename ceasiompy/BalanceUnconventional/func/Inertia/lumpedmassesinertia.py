@@ -19,6 +19,10 @@ using the lumped masses method.
 
 import numpy as np
 import math
+import os
+
+from functools import lru_cache
+from itertools import chain, repeat
 
 from cpacspy.cpacsfunctions import open_tigl, open_tixi
 
@@ -26,6 +30,19 @@ from ceasiompy.utils.ceasiomlogger import get_logger
 
 log = get_logger()
 
+# Axis normal to each symmetry plane (1: x-y plane, 2: x-z plane, 3: y-z plane)
+SYM_AXIS = {1: 2, 2: 1, 3: 0}
+
+# Golden angle [rad], used to spread the radial nodes of fuselage sections
+GOLDEN_ANGLE = np.pi * (3 - np.sqrt(5))
+
+# Precision of the lumped nodes coordinates, the inertia sums are always
+# evaluated in double precision
+NODE_DTYPE = np.float32
+
+# Number of nodes reduced at once in lumped_masses_inertia
+NODE_BLOCK_SIZE = 16384
+
 
 # =============================================================================
 #   CLASSES
@@ -38,6 +55,133 @@ log = get_logger()
 # =============================================================================
 #   FUNCTIONS
 # =============================================================================
+
+
+@lru_cache(maxsize=4)
+def _open_cpacs(cpacs_in, mtime):
+    """Open tixi and tigl handles, cached by CPACS path and modification time."""
+
+    tixi = open_tixi(cpacs_in)
+
+    return (tixi, open_tigl(tixi))
+
+
+def get_tigl(cpacs_in):
+    """The function returns the tigl handle of a CPACS file, the same handle
+    is reused by the inertia functions as long as the file is not modified.
+
+    INPUT
+    (char) cpacs_in --Arg.: Cpacs xml file location.
+
+    OUTPUT
+    (handle) tigl --Out.: Tigl handle.
+    """
+
+    (_, tigl) = _open_cpacs(str(cpacs_in), os.path.getmtime(cpacs_in))
+
+    return tigl
+
+
+def get_surface_points(get_point, c, i, et, ze):
+    """The function evaluates a set of points on a fuselage or wing segment
+    and stores them directly into a single array.
+
+    INPUT
+    (function) get_point --Arg.: Tigl point function, e.g.
+                                 tigl.fuselageGetPoint or
+                                 tigl.wingGetLowerPoint.
+    (int) c          --Arg.: Fuselage or wing index.
+    (int) i          --Arg.: Segment index.
+    (float_array) et --Arg.: Eta coordinate of each point.
+    (float_array) ze --Arg.: Zeta coordinate of each point.
+
+    OUTPUT
+    (float_array) points --Out.: x,y,z coordinates of each point [m].
+    """
+
+    # Plain python floats are passed to Tigl and the returned coordinates
+    # are written straight into the output buffer
+    nb = np.size(et)
+    coords = chain.from_iterable(
+        map(get_point, repeat(c, nb), repeat(i, nb), np.ravel(et).tolist(), np.ravel(ze).tolist())
+    )
+    points = np.fromiter(coords, dtype=NODE_DTYPE, count=3 * nb)
+
+    return points.reshape(nb, 3)
+
+
+@lru_cache(maxsize=None)
+def golden_angle_table(n):
+    """The function returns the cosine and sine of the first n multiples
+    of the golden angle, the tables are computed once for each n.
+
+    INPUT
+    (int) n --Arg.: Number of angles.
+
+    OUTPUT
+    (float_array) cos_theta --Out.: Cosine of each angle.
+    (float_array) sin_theta --Out.: Sine of each angle.
+    """
+
+    theta = GOLDEN_ANGLE * np.arange(n)
+
+    return (np.cos(theta), np.sin(theta))
+
+
+def get_radial_nodes(edge_points, yc, zc, D):
+    """The function evaluates the nodes that fill each fuselage station,
+    the nodes are placed along a golden angle spiral around the center
+    of the section.
+
+    INPUT
+    (float_array) edge_points --Arg.: x,y,z coordinates of the starting
+                                      point of each station [m].
+    (float) yc       --Arg.: y-coordinate of the section center [m].
+    (float) zc       --Arg.: z-coordinate of the section center [m].
+    (float_array) D  --Arg.: Relative radial distance of each node.
+
+    OUTPUT
+    (float_array) nodes --Out.: x,y,z coordinates of the nodes [m].
+    """
+
+    deltar = np.outer(np.sqrt((edge_points[:, 1] - yc) ** 2 + (edge_points[:, 2] - zc) ** 2), D)
+    (cos_theta, sin_theta) = golden_angle_table(len(D))
+    nodes = np.empty((len(edge_points), len(D), 3), dtype=NODE_DTYPE)
+    nodes[:, :, 0] = edge_points[:, [0]]
+    nodes[:, :, 1] = yc + deltar * cos_theta
+    nodes[:, :, 2] = zc + deltar * sin_theta
+
+    return nodes.reshape(-1, 3)
+
+
+def lumped_masses_inertia(nodes, center_of_gravity, node_mass):
+    """The function evaluates the inertia of a set of lumped masses,
+    the six moments are obtained from a single pass over the nodes.
+
+    INPUT
+    (float_array) nodes --Arg.: x,y,z coordinates of the nodes [m].
+    (float_array) center_of_gravity --Arg.: x,y,z coordinates of the CoG.
+    (float_array) node_mass --Arg.: Mass of each node, or a single value
+                                    if all nodes have the same mass [kg].
+
+    OUTPUT
+    (float_array) inertia --Out.: Ixx, Iyy, Izz, Ixy, Iyz, Ixz [kgm^2].
+    """
+
+    cog = np.asarray(center_of_gravity, dtype=np.float64)
+    node_mass = np.broadcast_to(node_mass, (len(nodes),))
+    # The nodes are processed by blocks so that the double precision
+    # temporaries stay in cache
+    S = np.zeros((3, 3))
+    for start in range(0, len(nodes), NODE_BLOCK_SIZE):
+        dist = nodes[start : start + NODE_BLOCK_SIZE] - cog
+        S += (node_mass[start : start + NODE_BLOCK_SIZE] * dist.T) @ dist
+
+    return np.array(
+        [S[1, 1] + S[2, 2], S[0, 0] + S[2, 2], S[0, 0] + S[1, 1], S[0, 1], S[1, 2], S[0, 2]]
+    )
+
+
 def fuselage_inertia(SPACING, center_of_gravity, mass_seg_i, afg, cpacs_in):
     """Thefunction evaluates the inertia of the fuselage using the lumped
     masses method.
@@ -52,84 +196,74 @@ def fuselage_inertia(SPACING, center_of_gravity, mass_seg_i, afg, cpacs_in):
     (char) cpacs_in --Arg.: Cpacs xml file location.
 
     OUTPUT
-    (float) sfx --Out.: Lumped nodes x-coordinate [m].
-    (float) sfy --Out.: Lumped nodes y-coordinate [m].
-    (float) sfz --Out.: Lumped nodes z-coordinate [m].
+    (float_array) sfx --Out.: Lumped nodes x-coordinate [m].
+    (float_array) sfy --Out.: Lumped nodes y-coordinate [m].
+    (float_array) sfz --Out.: Lumped nodes z-coordinate [m].
     (float) Ixx --Out.: Moment of inertia respect to the x-axis [kgm^2].
     (float) Iyy --Out.: Moment of inertia respect to the y-axis [kgm^].
     (float) Izz --Out.: Moment of inertia respect to the z-axis [kgm^2].
+    (float) Ixy --Out.: Product of inertia in the xy-plane [kgm^2].
+    (float) Iyz --Out.: Product of inertia in the yz-plane [kgm^2].
+    (float) Ixz --Out.: Product of inertia in the xz-plane [kgm^2].
     """
 
-    tixi = open_tixi(cpacs_in)
-    tigl = open_tigl(tixi)
-
-    sfx = []
-    sfy = []
-    sfz = []
-    Ixx = 0
-    Iyy = 0
-    Izz = 0
-    Ixy = 0
-    Iyz = 0
-    Ixz = 0
+    tigl = get_tigl(cpacs_in)
+
+    # Length, section perimeter and section width of each segment gathered
+    # in a single array, so that each segment reads one contiguous record
+    seg_nb = np.shape(afg.fuse_seg_length)[0]
+    seg_geom = np.stack(
+        (
+            afg.fuse_seg_length,
+            afg.fuse_sec_per[:seg_nb],
+            afg.fuse_sec_width[:seg_nb],
+        ),
+        axis=-1,
+    )
+    centers = np.asarray(afg.fuse_center_section_point)
+
+    fuse_nodes = [np.empty((0, 3), dtype=NODE_DTYPE)]
+    node_mass = [np.empty(0)]
     log.info("-------------------------------------------------------------")
     log.info("---- Evaluating fuselage nodes for lumped masses inertia ----")
     log.info("-------------------------------------------------------------")
     for f in range(1, afg.fus_nb + 1):
-        for i in afg.f_seg_sec[:, f - 1, 2]:
-            fx = []
-            fy = []
-            fz = []
+        for ii in afg.f_seg_sec[:, f - 1, 2].astype(np.intp, copy=False):
+            im1 = ii - 1
+            (length, per, width) = seg_geom[im1, f - 1]
             # Number of subdivisions along the longitudinal axis
-            subd_l = math.ceil((afg.fuse_seg_length[int(i) - 1][f - 1] / SPACING))
+            subd_l = max(1, math.ceil(length / SPACING))
             # Number of subdivisions along the perimeter
-            SUBD_C0 = math.ceil((afg.fuse_sec_per[int(i) - 1][f - 1] / SPACING))
+            SUBD_C0 = max(1, math.ceil(per / SPACING))
             # Number of subdivisions along the radial axis
-            subd_r = math.ceil(((afg.fuse_sec_width[int(i) - 1][f - 1] / 2) / SPACING))
-            if subd_l == 0:
-                subd_l = 1.0
-            if SUBD_C0 == 0:
-                SUBD_C0 = 1.0
-            if subd_r == 0:
-                subd_r = 1.0
+            subd_r = max(1, math.ceil((width / 2) / SPACING))
             eta = 1.0 / (subd_l)
             zeta = 1.0 / (SUBD_C0)
             D0 = np.sqrt(np.arange(subd_r * SUBD_C0) / float(subd_r * SUBD_C0))
-            D = np.array([t for t in (D0 - (D0[-1] - 0.98)) if not t < 0])
-            (xc, yc, zc) = afg.fuse_center_section_point[int(i) - 1][f - 1][:]
-            for j in range(int(subd_l) + 1):
-                et = j * eta
-                for k in range(int(SUBD_C0) + 1):
-                    ze = k * zeta
-                    (x0, y0, z0) = tigl.fuselageGetPoint(f, int(i), et, ze)
-                    fx.append(x0)
-                    fy.append(y0)
-                    fz.append(z0)
-                    sfx.append(x0)
-                    sfy.append(y0)
-                    sfz.append(z0)
-                if subd_r > 0.0:
-                    deltar = np.sqrt((y0 - yc) ** 2 + (z0 - zc) ** 2) * D
-                    theta = np.pi * (3 - np.sqrt(5)) * np.arange(len(D))
-                    x = np.zeros(np.shape(deltar)) + x0
-                    y = yc + deltar * np.cos(theta)
-                    z = zc + deltar * np.sin(theta)
-                    fx.extend(x)
-                    fy.extend(y)
-                    fz.extend(z)
-                    sfx.extend(x)
-                    sfy.extend(y)
-                    sfz.extend(z)
-            M = mass_seg_i[int(i) - 1, f - 1] / np.max(np.shape(fx))
-            fcx = fx - (np.zeros((np.shape(fx))) + center_of_gravity[0])
-            fcy = fy - (np.zeros((np.shape(fx))) + center_of_gravity[1])
-            fcz = fz - (np.zeros((np.shape(fx))) + center_of_gravity[2])
-            Ixx += np.sum(M * np.add(fcy**2, fcz**2))
-            Iyy += np.sum(M * np.add(fcx**2, fcz**2))
-            Izz += np.sum(M * np.add(fcx**2, fcy**2))
-            Ixy += np.sum(M * fcx * fcy)
-            Iyz += np.sum(M * fcy * fcz)
-            Ixz += np.sum(M * fcx * fcz)
+            D = D0 - (D0[-1] - 0.98)
+            D = D[D >= 0]
+            (xc, yc, zc) = centers[im1, f - 1]
+            (et, ze) = np.meshgrid(
+                np.arange(subd_l + 1) * eta,
+                np.arange(SUBD_C0 + 1) * zeta,
+                indexing="ij",
+            )
+            # Surface nodes followed by the radial nodes of each station
+            surf_nb = et.size
+            nodes = np.empty((surf_nb + (subd_l + 1) * len(D), 3), dtype=NODE_DTYPE)
+            nodes[:surf_nb] = get_surface_points(tigl.fuselageGetPoint, f, ii, et, ze)
+            # The last point of each station (zeta = 1) is the starting point
+            # of the radial fill of the section
+            edge_points = nodes[:surf_nb].reshape(subd_l + 1, SUBD_C0 + 1, 3)[:, -1]
+            nodes[surf_nb:] = get_radial_nodes(edge_points, yc, zc, D)
+            fuse_nodes.append(nodes)
+            node_mass.append(np.full(len(nodes), mass_seg_i[im1, f - 1] / len(nodes)))
+    # The inertia of all the fuselage nodes is evaluated at once
+    fuse_nodes = np.concatenate(fuse_nodes)
+    (Ixx, Iyy, Izz, Ixy, Iyz, Ixz) = lumped_masses_inertia(
+        fuse_nodes, center_of_gravity, np.concatenate(node_mass)
+    )
+    (sfx, sfy, sfz) = fuse_nodes.T
 
     return (sfx, sfy, sfz, Ixx, Iyy, Izz, Ixy, Iyz, Ixz)
 
@@ -156,119 +290,77 @@ def wing_inertia(subd_c, SPACING, fuse, center_of_gravity, mass_seg_i, awg, cpac
     (char) cpacs_in --Arg.: Cpacs xml file location.
 
     OUTPUT
-    (float) swx --Out.: Lumped nodes x-coordinate [m].
-    (float) swy --Out.: Lumped nodes y-coordinate [m].
-    (float) swz --Out.: Lumped nodes z-coordinate [m].
+    (float_array) swx --Out.: Lumped nodes x-coordinate [m].
+    (float_array) swy --Out.: Lumped nodes y-coordinate [m].
+    (float_array) swz --Out.: Lumped nodes z-coordinate [m].
     (float) Ixx --Out.: Moment of inertia respect to the x-axis [kgm^2].
     (float) Iyy --Out.: Moment of inertia respect to the y-axis [kgm^].
     (float) Izz --Out.: Moment of inertia respect to the z-axis [kgm^2].
+    (float) Ixy --Out.: Product of inertia in the xy-plane [kgm^2].
+    (float) Iyz --Out.: Product of inertia in the yz-plane [kgm^2].
+    (float) Ixz --Out.: Product of inertia in the xz-plane [kgm^2].
 
     """
-    tixi = open_tixi(cpacs_in)
-    tigl = open_tigl(tixi)
+    tigl = get_tigl(cpacs_in)
 
     log.info("-------------------------------------------------------------")
     log.info("------ Evaluating wing nodes for lumped masses inertia ------")
     log.info("-------------------------------------------------------------")
 
-    Ixx = 0
-    Iyy = 0
-    Izz = 0
-    Ixy = 0
-    Iyz = 0
-    Ixz = 0
-    swx = []
-    swy = []
-    swz = []
+    wing_nodes = [np.empty((0, 3), dtype=NODE_DTYPE)]
+    node_mass = [np.empty(0)]
     a = 0
+    # Sum of the integers from 0 to subd_c + 1
+    DEN = (int(subd_c) + 2) * (int(subd_c) + 1) / 2.0
+    zeta = 1.0 / DEN
+    # Zeta of the chordwise nodes, the distance between nodes grows by zeta
+    # at each step
+    ze_steps = np.cumsum(np.arange(int(subd_c) + 1) * zeta)
+    lower_point = tigl.wingGetLowerPoint
+    upper_point = tigl.wingGetUpperPoint
     for w in range(1, awg.w_nb + 1):
-        DEN = 0.0
-        for d in range(int(subd_c + 2)):
-            DEN = DEN + d
-        zeta = 1.0 / DEN
-        for i in awg.w_seg_sec[:, w - 1, 2]:
-            if i == 0.0:
+        for ii in awg.w_seg_sec[:, w - 1, 2].astype(np.intp, copy=False):
+            if ii == 0:
                 break
-            wx = []
-            wy = []
-            wz = []
+            im1 = ii - 1
             # Number of subdivisions along the longitudinal axis
-            subd_l = math.ceil((awg.wing_seg_length[int(i) - 1][w + a - 1] / SPACING))
-            if subd_l == 0:
-                subd_l = 1
+            subd_l = max(1, math.ceil(awg.wing_seg_length[im1][w + a - 1] / SPACING))
             eta = 1.0 / subd_l
-            et = 0.0
-            (xc, yc, zc) = awg.wing_center_seg_point[int(i) - 1][w + a - 1][:]
-            for j in range(int(subd_l) + 1):
-                et = j * eta
-                (xle, yle, zle) = tigl.wingGetLowerPoint(w, int(i), et, 0.0)
-                (xle2, yle2, zle2) = tigl.wingGetLowerPoint(w, int(i), et, 1.0)
-                if xle < xle2:
-                    ZLE = 0.0
-                    ze = 0.0
-                else:
-                    ZLE = 1.0
-                    ze = 1.0
-                wx.extend((xle, xle2))
-                wy.extend((yle, yle2))
-                wz.extend((zle, zle2))
-                swx.extend((xle, xle2))
-                swy.extend((yle, yle2))
-                swz.extend((zle, zle2))
-                for k in range(int(subd_c) + 1):
-                    if ZLE == 0.0:
-                        ze += float(k) * zeta
-                    elif ZLE == 1.0:
-                        ze -= float(k) * zeta
-                    (xl, yl, zl) = tigl.wingGetLowerPoint(w, int(i), et, ze)
-                    (xu, yu, zu) = tigl.wingGetUpperPoint(w, int(i), et, ze)
-                    wx.extend((xl, xu))
-                    wy.extend((yl, yu))
-                    wz.extend((zl, zu))
-                    swx.extend((xl, xu))
-                    swy.extend((yl, yu))
-                    swz.extend((zl, zu))
-            M = mass_seg_i[int(i) - 1, fuse + w + a - 1] / np.max(np.shape(wx))
-            wcx = wx - (np.zeros((np.shape(wx))) + center_of_gravity[0])
-            wcy = wy - (np.zeros((np.shape(wy))) + center_of_gravity[1])
-            wcz = wz - (np.zeros((np.shape(wz))) + center_of_gravity[2])
-            Ixx += np.sum(M * np.add(wcy**2, wcz**2))
-            Iyy += np.sum(M * np.add(wcx**2, wcz**2))
-            Izz += np.sum(M * np.add(wcx**2, wcy**2))
-            Ixy += np.sum(M * wcx * wcy)
-            Iyz += np.sum(M * wcy * wcz)
-            Ixz += np.sum(M * wcx * wcz)
+            (xc, yc, zc) = awg.wing_center_seg_point[im1][w + a - 1][:]
+            et = np.arange(subd_l + 1) * eta
+            le_points = get_surface_points(lower_point, w, ii, et, np.zeros_like(et))
+            te_points = get_surface_points(lower_point, w, ii, et, np.ones_like(et))
+            # The chordwise nodes go from the leading to the trailing edge
+            (et, ze) = np.meshgrid(et, ze_steps, indexing="ij")
+            reverse = le_points[:, 0] >= te_points[:, 0]
+            ze[reverse] = 1.0 - ze[reverse]
+            # Leading and trailing edge nodes followed by lower and upper
+            # surface nodes of each station
+            shape = (subd_l + 1, int(subd_c) + 1, 3)
+            nodes = np.empty((subd_l + 1, 2 * (int(subd_c) + 2), 3), dtype=NODE_DTYPE)
+            nodes[:, 0] = le_points
+            nodes[:, 1] = te_points
+            nodes[:, 2::2] = get_surface_points(lower_point, w, ii, et, ze).reshape(shape)
+            nodes[:, 3::2] = get_surface_points(upper_point, w, ii, et, ze).reshape(shape)
+            nodes = nodes.reshape(-1, 3)
+            wing_nodes.append(nodes)
+            M = mass_seg_i[im1, fuse + w + a - 1] / len(nodes)
+            node_mass.append(np.full(len(nodes), M))
             if awg.wing_sym[int(w) - 1] != 0:
-                if awg.wing_sym[int(w) - 1] == 1:  # x-y plane
-                    symy = 1 + np.zeros(np.shape(wy))
-                    symx = 1 + np.zeros(np.shape(wx))
-                    symz = -1 + np.zeros(np.shape(wz))
-                elif awg.wing_sym[int(w) - 1] == 2:  # x-z plane
-                    symy = -1 + np.zeros(np.shape(wy))
-                    symx = 1 + np.zeros(np.shape(wx))
-                    symz = 1 + np.zeros(np.shape(wz))
-                elif awg.wing_sym[int(w) - 1] == 3:  # y-z plane
-                    symy = 1 + np.zeros(np.shape(wy))
-                    symx = -1 + np.zeros(np.shape(wx))
-                    symz = 1 + np.zeros(np.shape(wz))
-                wx_t = wx * symx
-                wy_t = wy * symy
-                wz_t = wz * symz
-                [swx.append(x) for x in wx_t]
-                [swy.append(y) for y in wy_t]
-                [swz.append(z) for z in wz_t]
-                M = mass_seg_i[int(i) - 1, fuse + w + a - 1] / np.max(np.shape(wx_t))
-                wcx_t = wx_t - (np.zeros((np.shape(wx_t))) + center_of_gravity[0])
-                wcy_t = wy_t - (np.zeros((np.shape(wy_t))) + center_of_gravity[1])
-                wcz_t = wz_t - (np.zeros((np.shape(wz_t))) + center_of_gravity[2])
-                Ixx += np.sum(M * np.add(wcy_t**2, wcz_t**2))
-                Iyy += np.sum(M * np.add(wcx_t**2, wcz_t**2))
-                Izz += np.sum(M * np.add(wcx_t**2, wcy_t**2))
-                Ixy += np.sum(M * wcx_t * wcy_t)
-                Iyz += np.sum(M * wcy_t * wcz_t)
-                Ixz += np.sum(M * wcx_t * wcz_t)
+                # Mirroring only changes the sign of the axis normal to the
+                # symmetry plane
+                nodes_t = nodes.copy()
+                nodes_t[:, SYM_AXIS[int(awg.wing_sym[int(w) - 1])]] *= -1
+                wing_nodes.append(nodes_t)
+                node_mass.append(node_mass[-1])
         if awg.wing_sym[int(w) - 1] != 0:
             a += 1
+    # The inertia of all the wing nodes is evaluated at once
+    wing_nodes = np.concatenate(wing_nodes)
+    (Ixx, Iyy, Izz, Ixy, Iyz, Ixz) = lumped_masses_inertia(
+        wing_nodes, center_of_gravity, np.concatenate(node_mass)
+    )
+    (swx, swy, swz) = wing_nodes.T
 
     return (swx, swy, swz, Ixx, Iyy, Izz, Ixy, Iyz, Ixz)
 
@@ -277,7 +369,7 @@ def wing_inertia(subd_c, SPACING, fuse, center_of_gravity, mass_seg_i, awg, cpac
 
 
 def engine_inertia(center_of_gravity, EngineData):
-    """The function evaluates the inertia of the fuselage using the lumped
+    """The function evaluates the inertia of the engines using the lumped
     masses method.
 
     INPUT
@@ -290,24 +382,14 @@ def engine_inertia(center_of_gravity, EngineData):
     (float) Ixx --Out.: Moment of inertia respect to the x-axis [kgm^2].
     (float) Iyy --Out.: Moment of inertia respect to the y-axis [kgm^].
     (float) Izz --Out.: Moment of inertia respect to the z-axis [kgm^2].
+    (float) Ixy --Out.: Product of inertia in the xy-plane [kgm^2].
+    (float) Iyz --Out.: Product of inertia in the yz-plane [kgm^2].
+    (float) Ixz --Out.: Product of inertia in the xz-plane [kgm^2].
     """
-    Ixx = 0
-    Iyy = 0
-    Izz = 0
-    Ixy = 0
-    Iyz = 0
-    Ixz = 0
-
-    for e in range(0, EngineData.NE):
-        cx = EngineData.EN_PLACEMENT[e, 0] - center_of_gravity[0]
-        cy = EngineData.EN_PLACEMENT[e, 1] - center_of_gravity[1]
-        cz = EngineData.EN_PLACEMENT[e, 2] - center_of_gravity[2]
-        Ixx += EngineData.en_mass * np.add(cy**2, cz**2)
-        Iyy += EngineData.en_mass * np.add(cx**2, cz**2)
-        Izz += EngineData.en_mass * np.add(cx**2, cy**2)
-        Ixy += EngineData.en_mass * cx * cy
-        Iyz += EngineData.en_mass * cy * cz
-        Ixz += EngineData.en_mass * cx * cx
+    dist = EngineData.EN_PLACEMENT[: EngineData.NE] - np.asarray(center_of_gravity)
+    S = EngineData.en_mass * (dist.T @ dist)
+    (Ixx, Iyy, Izz) = (S[1, 1] + S[2, 2], S[0, 0] + S[2, 2], S[0, 0] + S[1, 1])
+    (Ixy, Iyz, Ixz) = (S[0, 1], S[1, 2], S[0, 2])
 
     return (Ixx, Iyy, Izz, Ixy, Iyz, Ixz)
 
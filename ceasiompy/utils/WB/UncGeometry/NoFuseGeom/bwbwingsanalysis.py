@@ -19,13 +19,16 @@ Python version: >=3.8
 # =============================================================================
 
 import numpy as np
-import math
 
 from cpacspy.cpacsfunctions import open_tigl, open_tixi
 from ceasiompy.utils.ceasiomlogger import get_logger
 
 log = get_logger()
 
+# Signs of the x, y, z coordinates mirrored by each symmetry plane, indexed
+# by the symmetry (0: none, 1: x-y plane, 2: x-z plane, 3: y-z plane)
+SYM_SIGNS = np.array([[1, 1, 1], [1, 1, -1], [1, -1, 1], [-1, 1, 1]], dtype=np.int8)
+
 
 # =============================================================================
 #   CLASSES
@@ -39,6 +42,22 @@ log = get_logger()
 #   FUNCTIONS
 # =============================================================================
 
+
+def ordered_unique(values):
+    """The function returns the unique values of an array in the order of
+        their first occurrence.
+
+    Args:
+        values (float_array): Array of values.
+
+    Returns:
+        unique_values (float_array): Unique values in order of first occurrence.
+    """
+
+    # Dictionary keys keep the insertion order and ignore repeated values
+    return np.array(list(dict.fromkeys(values.tolist())))
+
+
 # TODO: change function name
 def check_segment_connection(wing_plt_area_xz, wing_plt_area_yz, awg, tigl):
     """The function checks for each segment the start and end section index
@@ -55,9 +74,9 @@ def check_segment_connection(wing_plt_area_xz, wing_plt_area_yz, awg, tigl):
     Returns:
         sec_nb (int): Number of sections for each wing.
         start_index (int): Start section index for each wing.
-        seg_sec_reordered (float-array): Reordered segments with respective
-                                         start and end section for each wing.
-        sec_index (float_array): List of section index reordered.
+        seg_sec_reordered (int-array): Reordered segments with respective
+                                       start and end section for each wing.
+        sec_index (int_array): List of section index reordered.
     """
 
     log.info("-----------------------------------------------------------")
@@ -65,10 +84,11 @@ def check_segment_connection(wing_plt_area_xz, wing_plt_area_yz, awg, tigl):
     log.info("-----------------------------------------------------------")
 
     # Initialising arrays
-    nbmax = np.amax(awg.wing_seg_nb)
-    seg_sec = np.zeros((nbmax, awg.w_nb, 3))
-    seg_sec_reordered = np.zeros(np.shape(seg_sec))
-    sec_index = np.zeros((nbmax, awg.w_nb))
+    nbmax = max(awg.wing_seg_nb)
+    seg_sec = np.zeros((nbmax, awg.w_nb, 3), dtype=np.int32)
+    seg_sec_reordered = np.zeros(np.shape(seg_sec), dtype=np.int32)
+    # A wing has at most one section more than segments
+    sec_index = np.zeros((nbmax + 1, awg.w_nb), dtype=np.int32)
     start_index = []
     sec_nb = []
 
@@ -82,48 +102,52 @@ def check_segment_connection(wing_plt_area_xz, wing_plt_area_yz, awg, tigl):
     # WARNING The code does not work if a segment is defined and then not used.
     #         The aircraft should be designed along the x axis and on the x-y plane
 
+    inner_section = tigl.wingGetInnerSectionAndElementIndex
+    outer_section = tigl.wingGetOuterSectionAndElementIndex
+    chord_point = tigl.wingGetChordPoint
     for i in range(1, awg.w_nb + 1):
-        wing_sec_index = []
-        for j in range(1, awg.wing_seg_nb[i - 1] + 1):
-            (s0, e) = tigl.wingGetInnerSectionAndElementIndex(i, j)
-            (s1, e) = tigl.wingGetOuterSectionAndElementIndex(i, j)
+        seg_nb = awg.wing_seg_nb[i - 1]
+        for j in range(1, seg_nb + 1):
+            (s0, e) = inner_section(i, j)
+            (s1, e) = outer_section(i, j)
             seg_sec[j - 1, i - 1, 0] = s0
             seg_sec[j - 1, i - 1, 1] = s1
             seg_sec[j - 1, i - 1, 2] = j
-        (_, slpy, slpz) = tigl.wingGetChordPoint(i, 1, 0.0, 0.0)
-        seg_sec_reordered[0, i - 1, :] = seg_sec[0, i - 1, :]
+        # Leading edge point at the start of the first segment and at the
+        # end of the other ones, the start segment is the last one which
+        # lowers the running minimum of y (horizontal wings) or z
+        chord_points = [chord_point(i, 1, 0.0, 0.0)]
+        for j in range(2, seg_nb + 1):
+            chord_points.append(chord_point(i, j, 1.0, 0.0))
+        chord_points = np.array(chord_points)
+        if (
+            awg.wing_plt_area[i - 1] > wing_plt_area_xz[i - 1]
+            and awg.wing_plt_area[i - 1] > wing_plt_area_yz[i - 1]
+        ):
+            coord = chord_points[:, 1]
+        else:
+            coord = chord_points[:, 2]
+        lower_starts = np.flatnonzero(coord[1:] < np.minimum.accumulate(coord)[:-1]) + 2
         start_index.append(1)
-        for j in range(2, awg.wing_seg_nb[i - 1] + 1):
-            (x, y, z) = tigl.wingGetChordPoint(i, j, 1.0, 0.0)
-            if (
-                awg.wing_plt_area[i - 1] > wing_plt_area_xz[i - 1]
-                and awg.wing_plt_area[i - 1] > wing_plt_area_yz[i - 1]
-            ):
-                if y < slpy:
-                    (_, slpy, slpz) = (x, y, z)
-                    start_index.append(j)
-                    seg_sec_reordered[0, i - 1, :] = seg_sec[j - 1, i - 1, :]
-            else:
-                if z < slpz:
-                    (_, slpy, slpz) = (x, y, z)
-                    start_index.append(j)
-                    seg_sec_reordered[0, i - 1, :] = seg_sec[j - 1, i - 1, :]
-        for j in range(2, awg.wing_seg_nb[i - 1] + 1):
+        start_index.extend(lower_starts.tolist())
+        seg_sec_reordered[0, i - 1, :] = seg_sec[start_index[-1] - 1, i - 1, :]
+        # Segment starting at each section
+        start_seg = {seg_sec[k, i - 1, 0]: k for k in range(seg_nb)}
+        for j in range(2, seg_nb + 1):
             end_sec = seg_sec_reordered[j - 2, i - 1, 1]
-            start_next = np.where(seg_sec[:, i - 1, 0] == end_sec)
-            seg_sec_reordered[j - 1, i - 1, :] = seg_sec[start_next[0], i - 1, :]
-        wing_sec_index.append(seg_sec_reordered[0, 0, 0])
-        for j in range(2, awg.wing_seg_nb[i - 1] + 1):
-            if seg_sec_reordered[j - 1, i - 1, 0] not in wing_sec_index:
-                wing_sec_index.append(seg_sec_reordered[j - 1, i - 1, 0])
-        if seg_sec_reordered[j - 1, i - 1, 1] not in wing_sec_index:
-            wing_sec_index.append(seg_sec_reordered[j - 1, i - 1, 1])
-        nb = np.shape(wing_sec_index)
-        if nb[0] > nbmax:
-            nbmax = nb[0]
-        sec_index.resize(nbmax, awg.w_nb)
-        sec_index[0 : nb[0], i - 1] = wing_sec_index[0 : nb[0]]
-        sec_nb.append(nb[0])
+            seg_sec_reordered[j - 1, i - 1, :] = seg_sec[start_seg[end_sec], i - 1, :]
+        # Start section of each reordered segment and end section of the last one
+        wing_sec_index = ordered_unique(
+            np.concatenate(
+                (
+                    [seg_sec_reordered[0, 0, 0]],
+                    seg_sec_reordered[1:seg_nb, i - 1, 0],
+                    [seg_sec_reordered[seg_nb - 1, i - 1, 1]],
+                )
+            )
+        )
+        sec_index[0 : wing_sec_index.size, i - 1] = wing_sec_index
+        sec_nb.append(wing_sec_index.size)
 
     return (sec_nb, start_index, seg_sec_reordered, sec_index)
 
@@ -137,7 +161,8 @@ def getwingsegmentlength(awg, wing_center_section_point):
                      aircraft_geometry_class.py in the
                      classes folder for explanation.
         wing_center_section_point (float): Central point of each segment
-                                           defined at 1/4 of the chord.
+                                           defined at 1/4 of the chord,
+                                           shaped (w_nb, max_wing_sec_nb, 3).
 
     Retruns:
         awg (class): AircraftWingGeometry class updated.
@@ -147,20 +172,21 @@ def getwingsegmentlength(awg, wing_center_section_point):
     log.info("-----------------------------------------------------------")
     log.info("---------- Evaluating wings segments length ---------------")
     log.info("-----------------------------------------------------------")
-    max_seg_nb = np.amax(awg.wing_seg_nb)
-    awg.wing_seg_length = np.zeros((max_seg_nb, awg.wing_nb))
+    max_seg_nb = max(awg.wing_seg_nb)
+    # Every column is written below, including the symmetric wings
+    awg.wing_seg_length = np.empty((max_seg_nb, awg.wing_nb))
 
     # To evaluate the length of each segment, the ditance of central point
-    # of the start and end section of each segment is computed
+    # of the start and end section of each segment is computed, for all the
+    # wings at once
+    d = np.diff(wing_center_section_point[:, : max_seg_nb + 1], axis=1)
+    seg_length = np.sqrt(np.einsum("ijk,ijk->ij", d, d))
+    # Segments beyond the number of segments of a wing have no length
+    seg_length[np.arange(max_seg_nb) >= np.asarray(awg.wing_seg_nb)[:, np.newaxis]] = 0.0
 
     a = 0
     for i in range(1, awg.w_nb + 1):
-        for j in range(1, awg.wing_seg_nb[i - 1] + 1):
-            (x1, y1, z1) = wing_center_section_point[j - 1, i - 1, :]
-            (x2, y2, z2) = wing_center_section_point[j, i - 1, :]
-            awg.wing_seg_length[j - 1][i + a - 1] = math.sqrt(
-                (x1 - x2) ** 2 + (y1 - y2) ** 2 + (z1 - z2) ** 2
-            )
+        awg.wing_seg_length[:, i + a - 1] = seg_length[i - 1]
         if awg.wing_sym[i - 1] != 0:
             awg.wing_seg_length[:, i + a] = awg.wing_seg_length[:, i + a - 1]
             a += 1
@@ -168,7 +194,7 @@ def getwingsegmentlength(awg, wing_center_section_point):
     return awg
 
 
-def geom_eval(w_nb, awg, cpacs_in):
+def geom_eval(w_nb, awg, cpacs_in, tigl=None):
     """Main function to evaluate the wings geometry.
 
     Args:
@@ -176,6 +202,8 @@ def geom_eval(w_nb, awg, cpacs_in):
         awg (class): AircraftWingGeometry class look at aircraft_geometry_class.py
                      in the classes folder for explanation.
         cpacs_in (str): Path to the CPACS file
+        tigl (handle): Tigl handle already opened on cpacs_in, if None the
+                       CPACS file is opened (and saved back) by the function.
 
     Returns:
         awg: AircraftWingGeometry class updated.
@@ -185,48 +213,50 @@ def geom_eval(w_nb, awg, cpacs_in):
     log.info("---------- Analysing wing geometry ------------------------")
     log.info("-----------------------------------------------------------")
 
-    # Opening tixi and tigl
-    tixi = open_tixi(cpacs_in)
-    tigl = open_tigl(tixi)
+    # Opening tixi and tigl, unless a tigl handle is given
+    tixi = None
+    if tigl is None:
+        tixi = open_tixi(cpacs_in)
+        tigl = open_tigl(tixi)
 
     # INITIALIZATION 1 ---------------------------------------------------------
     awg.w_nb = w_nb
     awg.wing_nb = w_nb
 
-    wing_plt_area_xz = []
-    wing_plt_area_yz = []
     wingUID = []
 
     # Counting sections and segments--------------------------------------------
 
+    wing_sym = np.empty(w_nb, dtype=int)
+    wing_sec_nb = np.empty(w_nb, dtype=int)
+    wing_seg_nb = np.empty(w_nb, dtype=int)
+    wing_vol = np.empty(w_nb)
+    # Reference area on the x-y, x-z and y-z planes
+    ref_area = np.empty((3, w_nb))
     for i in range(1, awg.w_nb + 1):
-        double = 1
-        awg.wing_sym.append(tigl.wingGetSymmetry(i))
-        if awg.wing_sym[i - 1] != 0:
-            double = 2  # To consider the real amount of wing
-            # when they are defined using symmetry
-            awg.wing_nb += 1
-        awg.wing_sec_nb.append(tigl.wingGetSectionCount(i))
-        awg.wing_seg_nb.append(tigl.wingGetSegmentCount(i))
-        awg.wing_vol.append(tigl.wingGetVolume(i) * double)
-        # x-y plane
-        awg.wing_plt_area.append(tigl.wingGetReferenceArea(i, 1) * double)
-        # x-z plane
-        wing_plt_area_xz.append(tigl.wingGetReferenceArea(i, 2) * double)
-        # y-z plane
-        wing_plt_area_yz.append(tigl.wingGetReferenceArea(i, 3) * double)
-        if (
-            awg.wing_plt_area[i - 1] > wing_plt_area_xz[i - 1]
-            and awg.wing_plt_area[i - 1] > wing_plt_area_yz[i - 1]
-        ):
-            awg.is_horiz.append(True)
-            if awg.wing_sym[i - 1] != 0:
-                awg.is_horiz.append(True)
-        else:
-            awg.is_horiz.append(False)
-            if awg.wing_sym[i - 1] != 0:
-                awg.is_horiz.append(False)
-        awg.wing_tot_vol += awg.wing_vol[i - 1]
+        wing_sym[i - 1] = tigl.wingGetSymmetry(i)
+        wing_sec_nb[i - 1] = tigl.wingGetSectionCount(i)
+        wing_seg_nb[i - 1] = tigl.wingGetSegmentCount(i)
+        wing_vol[i - 1] = tigl.wingGetVolume(i)
+        for plane in range(1, 4):
+            ref_area[plane - 1, i - 1] = tigl.wingGetReferenceArea(i, plane)
+
+    # To consider the real amount of wing when they are defined using symmetry
+    double = np.where(wing_sym != 0, 2, 1)
+    awg.wing_nb += int(np.count_nonzero(wing_sym))
+    wing_vol *= double
+    ref_area *= double
+    (wing_plt_area_xy, wing_plt_area_xz, wing_plt_area_yz) = ref_area
+    is_horiz = (wing_plt_area_xy > wing_plt_area_xz) & (wing_plt_area_xy > wing_plt_area_yz)
+
+    # The per-wing values are kept as lists on awg
+    awg.wing_sym.extend(wing_sym.tolist())
+    awg.wing_sec_nb.extend(wing_sec_nb.tolist())
+    awg.wing_seg_nb.extend(wing_seg_nb.tolist())
+    awg.wing_vol.extend(wing_vol.tolist())
+    awg.wing_plt_area.extend(wing_plt_area_xy.tolist())
+    awg.is_horiz.extend(np.repeat(is_horiz, double).tolist())
+    awg.wing_tot_vol += sum(awg.wing_vol)
 
     # Checking segment and section connection and reordering them
     (awg.wing_sec_nb, start_index, seg_sec, wing_sec_index) = check_segment_connection(
@@ -235,39 +265,45 @@ def geom_eval(w_nb, awg, cpacs_in):
 
     # INITIALIZATION 2 ---------------------------------------------------------
 
-    max_wing_sec_nb = np.amax(awg.wing_sec_nb)
-    max_wing_seg_nb = np.amax(awg.wing_seg_nb)
-    wing_center_section_point = np.zeros((max_wing_sec_nb, awg.w_nb, 3))
+    max_wing_sec_nb = max(awg.wing_sec_nb)
+    max_wing_seg_nb = max(awg.wing_seg_nb)
+    # Wing-major, so that the sections of a wing are contiguous in memory
+    wing_center_section_point = np.zeros((awg.w_nb, max_wing_sec_nb, 3))
     awg.wing_center_seg_point = np.zeros((max_wing_seg_nb, awg.wing_nb, 3))
     awg.wing_seg_vol = np.zeros((max_wing_seg_nb, awg.w_nb))
-    awg.wing_mac = np.zeros((4, awg.w_nb))
+    # Fully written in the wing loop (length and x, y, z of the MAC)
+    awg.wing_mac = np.empty((4, awg.w_nb))
     awg.wing_sec_thickness = np.zeros((max_wing_sec_nb, awg.w_nb))
 
     # WING ANALYSIS ------------------------------------------------------------
     # Wing: MAC,chords,thicknes,span,plantform area ----------------------------
 
+    chord_point = tigl.wingGetChordPoint
+    lower_point = tigl.wingGetLowerPoint
+    upper_point = tigl.wingGetUpperPoint
+    # Leading and trailing edge points of the root and tip chords
+    root_chord_pts = np.empty((2, awg.w_nb, 3))
+    tip_chord_pts = np.empty((2, awg.w_nb, 3))
     b = 0
     for i in range(1, awg.w_nb + 1):
+        seg_nb = awg.wing_seg_nb[i - 1]
         wingUID.append(tigl.wingGetUID(i))
         mac = tigl.wingGetMAC(wingUID[i - 1])
-        (wpx, wpy, wpz) = tigl.wingGetChordPoint(i, 1, 0.0, 0.0)
-        (wpx2, wpy2, wpz2) = tigl.wingGetChordPoint(i, 1, 0.0, 1.0)
-        awg.wing_max_chord.append(
-            np.sqrt((wpx2 - wpx) ** 2 + (wpy2 - wpy) ** 2 + (wpz2 - wpz) ** 2)
-        )
-        (wpx, wpy, wpz) = tigl.wingGetChordPoint(i, awg.wing_seg_nb[i - 1], 1.0, 0.0)
-        (wpx2, wpy2, wpz2) = tigl.wingGetChordPoint(i, awg.wing_seg_nb[i - 1], 1.0, 1.0)
-        awg.wing_min_chord.append(
-            np.sqrt((wpx2 - wpx) ** 2 + (wpy2 - wpy) ** 2 + (wpz2 - wpz) ** 2)
+        root_chord_pts[:, i - 1] = (chord_point(i, 1, 0.0, 0.0), chord_point(i, 1, 0.0, 1.0))
+        tip_chord_pts[:, i - 1] = (
+            chord_point(i, seg_nb, 1.0, 0.0),
+            chord_point(i, seg_nb, 1.0, 1.0),
         )
-        for k in range(1, 5):
-            awg.wing_mac[k - 1][i - 1] = mac[k - 1]
-        for jj in range(1, awg.wing_seg_nb[i - 1] + 1):
-            j = int(seg_sec[jj - 1, i - 1, 2])
-            cle = tigl.wingGetChordPoint(i, j, 0.0, 0.0)
-            awg.wing_seg_vol[j - 1][i - 1] = tigl.wingGetSegmentVolume(i, j)
-            lp = tigl.wingGetLowerPoint(i, j, 0.0, 0.0)
-            up = tigl.wingGetUpperPoint(i, j, 0.0, 0.0)
+        awg.wing_mac[:, i - 1] = mac
+        # Lower and upper points of each section are first collected, the
+        # last row is the tip section of the wing
+        lower_pts = np.empty((seg_nb + 1, 3))
+        upper_pts = np.empty((seg_nb + 1, 3))
+        for j in seg_sec[:seg_nb, i - 1, 2].tolist():
+            cle = chord_point(i, j, 0.0, 0.0)
+            awg.wing_seg_vol[j - 1, i - 1] = tigl.wingGetSegmentVolume(i, j)
+            lp = lower_point(i, j, 0.0, 0.0)
+            up = upper_point(i, j, 0.0, 0.0)
             if np.all(cle == lp):
                 L = 0.25
             else:
@@ -276,34 +312,33 @@ def geom_eval(w_nb, awg, cpacs_in):
                 U = 0.25
             else:
                 U = 0.75
-            (wplx, wply, wplz) = tigl.wingGetLowerPoint(i, j, 0.0, L)
-            (wpux, wpuy, wpuz) = tigl.wingGetUpperPoint(i, j, 0.0, U)
-            wing_center_section_point[j - 1][i - 1][0] = (wplx + wpux) / 2
-            wing_center_section_point[j - 1][i - 1][1] = (wply + wpuy) / 2
-            wing_center_section_point[j - 1][i - 1][2] = (wplz + wpuz) / 2
-            awg.wing_sec_thickness[j - 1][i - 1] = np.sqrt(
-                (wpux - wplx) ** 2 + (wpuy - wply) ** 2 + (wpuz - wplz) ** 2
-            )
-        j = int(seg_sec[awg.wing_seg_nb[i - 1] - 1, i - 1, 2])
-        (wplx, wply, wplz) = tigl.wingGetLowerPoint(i, awg.wing_seg_nb[i - 1], 1.0, L)
-        (wpux, wpuy, wpuz) = tigl.wingGetUpperPoint(i, awg.wing_seg_nb[i - 1], 1.0, U)
-        awg.wing_sec_thickness[j][i - 1] = np.sqrt(
-            (wpux - wplx) ** 2 + (wpuy - wply) ** 2 + (wpuz - wplz) ** 2
-        )
-        wing_center_section_point[awg.wing_seg_nb[i - 1]][i - 1][0] = (wplx + wpux) / 2
-        wing_center_section_point[awg.wing_seg_nb[i - 1]][i - 1][1] = (wply + wpuy) / 2
-        wing_center_section_point[awg.wing_seg_nb[i - 1]][i - 1][2] = (wplz + wpuz) / 2
-        awg.wing_sec_mean_thick.append(
-            np.mean(awg.wing_sec_thickness[0 : awg.wing_seg_nb[i - 1] + 1, i - 1])
-        )
+            lower_pts[j - 1] = lower_point(i, j, 0.0, L)
+            upper_pts[j - 1] = upper_point(i, j, 0.0, U)
+        j = seg_sec[seg_nb - 1, i - 1, 2]
+        lower_pts[-1] = lower_point(i, seg_nb, 1.0, L)
+        upper_pts[-1] = upper_point(i, seg_nb, 1.0, U)
+        # Center points and thicknesses of all the sections
+        wing_center_section_point[i - 1, : seg_nb + 1] = (lower_pts + upper_pts) / 2
+        thickness = np.linalg.norm(upper_pts - lower_pts, axis=1)
+        awg.wing_sec_thickness[:seg_nb, i - 1] = thickness[:-1]
+        awg.wing_sec_thickness[j, i - 1] = thickness[-1]
         # Wing Span Evaluation, Considering symmetry
         awg.wing_span.append(round(tigl.wingGetSpan(wingUID[i - 1]), 3))
-        a = np.amax(awg.wing_span)
+        a = max(awg.wing_span)
         # Evaluating the index that corresponds to the main wing
         if a > b:
             awg.main_wing_index = i
             b = a
 
+    awg.wing_max_chord = np.linalg.norm(root_chord_pts[1] - root_chord_pts[0], axis=1).tolist()
+    awg.wing_min_chord = np.linalg.norm(tip_chord_pts[1] - tip_chord_pts[0], axis=1).tolist()
+
+    # Mean thickness over the seg_nb + 1 sections of each wing
+    sec_count = np.asarray(awg.wing_seg_nb) + 1
+    in_wing = np.arange(max_wing_sec_nb)[:, np.newaxis] < sec_count
+    thick_sum = np.where(in_wing, awg.wing_sec_thickness, 0.0).sum(axis=0)
+    awg.wing_sec_mean_thick = (thick_sum / sec_count).tolist()
+
     # Main wing plantform area
     awg.wing_plt_area_main = awg.wing_plt_area[awg.main_wing_index - 1]
     # Wing segment length evaluatin function
@@ -330,40 +365,19 @@ def geom_eval(w_nb, awg, cpacs_in):
         if c:
             c = False
             continue
-        for jj in range(1, awg.wing_seg_nb[i - a - 1] + 1):
-            j = int(seg_sec[jj - 1, i - a - 1, 2])
-            awg.wing_center_seg_point[j - 1][i - 1][0] = (
-                wing_center_section_point[j - 1][i - a - 1][0]
-                + wing_center_section_point[j][i - a - 1][0]
-            ) / 2
-            awg.wing_center_seg_point[j - 1][i - 1][1] = (
-                wing_center_section_point[j - 1][i - a - 1][1]
-                + wing_center_section_point[j][i - a - 1][1]
-            ) / 2
-            awg.wing_center_seg_point[j - 1][i - 1][2] = (
-                wing_center_section_point[j - 1][i - a - 1][2]
-                + wing_center_section_point[j][i - a - 1][2]
-            ) / 2
+        j = seg_sec[: awg.wing_seg_nb[i - a - 1], i - a - 1, 2]
+        awg.wing_center_seg_point[j - 1, i - 1] = (
+            wing_center_section_point[i - a - 1, j - 1] + wing_center_section_point[i - a - 1, j]
+        ) / 2
         if awg.wing_sym[i - 1 - a] != 0:
-            if awg.wing_sym[i - 1 - a] == 1:
-                symy = 1
-                symx = 1
-                symz = -1
-            if awg.wing_sym[i - 1 - a] == 2:
-                symy = -1
-                symx = 1
-                symz = 1
-            if awg.wing_sym[i - 1 - a] == 3:
-                symy = 1
-                symx = -1
-                symz = 1
-            awg.wing_center_seg_point[:, i, 0] = awg.wing_center_seg_point[:, i - 1, 0] * symx
-            awg.wing_center_seg_point[:, i, 1] = awg.wing_center_seg_point[:, i - 1, 1] * symy
-            awg.wing_center_seg_point[:, i, 2] = awg.wing_center_seg_point[:, i - 1, 2] * symz
+            awg.wing_center_seg_point[:, i] = (
+                awg.wing_center_seg_point[:, i - 1] * SYM_SIGNS[awg.wing_sym[i - 1 - a]]
+            )
             c = True
             a += 1
 
-    tixi.save(cpacs_in)
+    if tixi is not None:
+        tixi.save(cpacs_in)
 
     # log info display ------------------------------------------------------------
     log.info("-----------------------------------------------------------")
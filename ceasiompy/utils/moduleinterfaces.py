@@ -103,16 +103,24 @@ class CPACSInOut:
         Attributes:
             inputs (list): List of CPACS inputs
             outputs (list): List of CPACS output
+            required_xpaths (list): Xpaths of the inputs without default value
         """
 
         self.inputs = []
         self.outputs = []
+        self.required_xpaths = []
+
+        # GUI dictionary, built on first request and reset when inputs change
+        self._gui_dict = None
 
     def add_input(self, **kwargs):
         """Add a new entry to the inputs list"""
 
         entry = _Entry(**kwargs)
         self.inputs.append(entry)
+        if entry.default_value is None:
+            self.required_xpaths.append(entry.xpath)
+        self._gui_dict = None
 
     def add_output(self, **kwargs):
         """Add a new entry to the outputs list"""
@@ -125,7 +133,15 @@ class CPACSInOut:
         self.outputs.append(entry)
 
     def get_gui_dict(self):
-        """Return a dictionary which can be processed by the GUI engine"""
+        """Return a dictionary which can be processed by the GUI engine
+
+        Note:
+            * The dictionary is built once and reused until a new input is added,
+              the Settings page requests it for every module at each rerun
+        """
+
+        if self._gui_dict is not None:
+            return self._gui_dict
 
         gui_settings_dict = {}
         for entry in self.inputs:
@@ -143,6 +159,8 @@ class CPACSInOut:
                 entry.gui_group,
             )
 
+        self._gui_dict = gui_settings_dict
+
         return gui_settings_dict
 
 
@@ -202,14 +220,17 @@ def check_cpacs_input_requirements(
         specs_module = get_specs_for_module(module_name, raise_error=True)
         cpacs_inout = specs_module.cpacs_inout
 
-    tixi = open_tixi(cpacs_file)
-    missing_nodes = []
-    for entry in cpacs_inout.inputs:
+    # Nothing to check, the CPACS file does not need to be opened
+    if not cpacs_inout.required_xpaths:
+        return
 
-        if entry.default_value is not None:
-            continue
-        if tixi.checkElement(entry.xpath) is False:
-            missing_nodes.append(entry.xpath)
+    # Each xpath is checked only once, even if required by several inputs
+    tixi = open_tixi(cpacs_file)
+    missing_nodes = [
+        xpath
+        for xpath in dict.fromkeys(cpacs_inout.required_xpaths)
+        if tixi.checkElement(xpath) is False
+    ]
 
     if missing_nodes:
         for missing in missing_nodes:
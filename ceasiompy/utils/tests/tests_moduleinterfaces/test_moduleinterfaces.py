@@ -100,6 +100,78 @@ def test_cpacs_inout():
     assert len(cpacs_inout.inputs) == 1
     assert len(cpacs_inout.outputs) == 2
 
+    # Only inputs without default value are required
+    assert cpacs_inout.required_xpaths == []
+
+    cpacs_inout.add_input(
+        descr="Test description",
+        xpath="/cpacs/testpath/required",
+        default_value=None,
+        unit="m/s",
+        var_name=None,
+    )
+
+    assert cpacs_inout.required_xpaths == ["/cpacs/testpath/required"]
+
+
+def test_cpacs_inout_gui_dict():
+    """
+    Test that 'get_gui_dict()' is reused until a new input is added
+    """
+
+    cpacs_inout = CPACSInOut()
+
+    cpacs_inout.add_input(
+        var_name="first",
+        default_value=5,
+        unit="m/s",
+        descr="Test description",
+        xpath="/cpacs/testpath/first",
+        gui=True,
+        gui_name="First",
+        gui_group="Group",
+    )
+
+    gui_dict = cpacs_inout.get_gui_dict()
+    assert len(gui_dict) == 1
+    assert cpacs_inout.get_gui_dict() is gui_dict
+
+    cpacs_inout.add_input(
+        var_name="second",
+        default_value=2,
+        unit="m",
+        descr="Test description",
+        xpath="/cpacs/testpath/second",
+        gui=True,
+        gui_name="Second",
+        gui_group="Group",
+    )
+
+    new_gui_dict = cpacs_inout.get_gui_dict()
+    assert len(new_gui_dict) == 2
+    assert [value[0] for value in new_gui_dict.values()] == ["First", "Second"]
+
+
+def test_check_cpacs_input_requirements_no_required_input():
+    """
+    Test that "check_cpacs_input_requirements()" does not open the CPACS file
+    when all inputs have a default value
+    """
+
+    cpacs_inout = CPACSInOut()
+
+    cpacs_inout.add_input(
+        var_name="cruise_alt",
+        default_value=12000,
+        unit="m",
+        descr="Aircraft cruise altitude",
+        xpath=RANGE_XPATH + "/cruiseAltitude",
+    )
+
+    cpacs_file = Path(MODULE_DIR, "ToolInput", "NotExistingFile.xml")
+
+    assert check_cpacs_input_requirements(cpacs_file, cpacs_inout=cpacs_inout) is None
+
 
 def test_check_cpacs_input_requirements():
     """
@@ -18,12 +18,11 @@ from collections import OrderedDict
 from pathlib import Path
 from cpacspy.cpacsfunctions import create_branch
 
-from tixi3 import tixi3wrapper
 from cpacspy.cpacsfunctions import open_tixi
 
 import pandas as pd
 import streamlit as st
-from ceasiompy.utils.moduleinterfaces import get_specs_for_module, get_toolinput_file_path
+from ceasiompy.utils.moduleinterfaces import get_specs_for_module
 from cpacspy.cpacsfunctions import (
     add_string_vector,
     add_value,
@@ -32,7 +31,6 @@ from cpacspy.cpacsfunctions import (
 )
 from cpacspy.cpacspy import CPACS
 from streamlitutils import create_sidebar
-from ceasiompy.utils.commonxpath import SU2MESH_XPATH
 
 import os
 
@@ -115,6 +113,7 @@ def section_edit_aeromap():
     st.markdown("#### Available aeromaps")
 
     aeromap_uid_list = st.session_state.cpacs.get_aeromap_uid_list()
+    aeromap_uid_set = set(aeromap_uid_list)
 
     for i, aeromap in enumerate(aeromap_uid_list):
         col1, col2, col3, _ = st.columns([6, 1, 1, 5])
@@ -188,7 +187,7 @@ def section_edit_aeromap():
     )
 
     if form.form_submit_button("Create new"):
-        if new_aeromap_uid not in aeromap_uid_list:
+        if new_aeromap_uid not in aeromap_uid_set:
             new_aeromap = st.session_state.cpacs.create_aeromap(new_aeromap_uid)
             new_aeromap.description = new_aeromap_description
             new_aeromap.add_row(mach=mach, alt=alt, aos=aos, aoa=aoa)
@@ -204,12 +203,17 @@ def section_edit_aeromap():
         uploaded_aeromap_uid = uploaded_csv.name.split(".csv")[0]
 
         if st.button("Add this aeromap"):
-            if uploaded_aeromap_uid in aeromap_uid_list:
+            if uploaded_aeromap_uid in aeromap_uid_set:
                 st.error("There is already an aeromap with this name!")
                 return
 
             new_aeromap = st.session_state.cpacs.create_aeromap(uploaded_aeromap_uid)
-            new_aeromap.df = pd.read_csv(uploaded_csv, keep_default_na=False)
+            try:
+                # pyarrow comes with streamlit, the C engine is kept as fallback
+                new_aeromap.df = pd.read_csv(uploaded_csv, engine="pyarrow", keep_default_na=False)
+            except (ImportError, ValueError):
+                uploaded_csv.seek(0)
+                new_aeromap.df = pd.read_csv(uploaded_csv, keep_default_na=False)
             new_aeromap.save()
             st.experimental_rerun()
 
@@ -286,6 +290,9 @@ def add_module_tab():
 
     st.session_state.xpath_to_update = {}
 
+    # Aeromaps are listed once for all the modules using an aeromap selection
+    aeromap_uid_list = st.session_state.cpacs.get_aeromap_uid_list()
+
     for m, (tab, module) in enumerate(
         zip(st.session_state.tabs, st.session_state.workflow_modules)
     ):
@@ -318,8 +325,6 @@ def add_module_tab():
                         name = f"{name} {unit}"
 
                     if name == "__AEROMAP_SELECTION":
-                        aeromap_uid_list = st.session_state.cpacs.get_aeromap_uid_list()
-
                         if not len(aeromap_uid_list):
                             st.error("You must create an aeromap in order to use this module!")
                             continue
@@ -340,8 +345,6 @@ def add_module_tab():
                         )
 
                     elif name == "__AEROMAP_CHECKBOX":
-                        aeromap_uid_list = st.session_state.cpacs.get_aeromap_uid_list()
-
                         if not len(aeromap_uid_list):
                             st.error("You must create an aeromap in order to use this module!")
                             continue